@@ -4,9 +4,12 @@ from pandasai import SmartDataframe
 from pandasai.llm import OpenAI
 from dotenv import load_dotenv
 
-def ai_clean(df):
+def ai_clean(df, stats=None):
     """
     Cleans the DataFrame using PandasAI with OpenAI GPT-4 Turbo.
+
+    `stats` (from data_loader.initial_analysis) is accepted so this can be
+    swapped with the local cleaner; the LLM does its own analysis.
     """
     load_dotenv()
     api_key = os.getenv("OPENAI_API_KEY")
@@ -17,7 +20,7 @@ def ai_clean(df):
     print("\nInitializing AI data cleaning process...")
     
     llm = OpenAI(api_token=api_key)
-    sdf = SmartDataframe(df, config={"llm": llm})
+    sdf = SmartDataframe(df.copy(deep=False), config={"llm": llm})
 
     # Prompt for cleaning the data
     cleaning_prompt = (
@@ -36,6 +39,7 @@ def ai_clean(df):
         print("AI cleaning process completed successfully.")
         # Save the cleaned data
         output_path = "data/cleaned/cleaned_dataset.csv"
+        # The LLM controls the returned dtypes, so keep pandas' own formatting
         cleaned_df.to_csv(output_path, index=False)
         print(f"Cleaned data saved to {output_path}")
         return cleaned_df
@@ -1,12 +1,92 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+try:
+    from .data_loader import ChunkDeduplicator, title_case_categories, write_csv
+except ImportError:  # run as a script from this directory
+    from data_loader import ChunkDeduplicator, title_case_categories, write_csv
 
-def ai_clean(df: pd.DataFrame) -> pd.DataFrame:
+try:
+    from numba import njit
+except ImportError:  # optional: fall back to the NumPy reduceat path
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _group_mean_fill(codes, vals, n_groups):
+        """
+        Fills NaNs in vals with the mean of their group in one hash-free pass
+        over (codes, vals); groups with no values are left as NaN.
+        """
+        sums = np.zeros(n_groups, dtype=np.float64)
+        counts = np.zeros(n_groups, dtype=np.float64)
+        for i in range(vals.shape[0]):
+            if not np.isnan(vals[i]):
+                sums[codes[i]] += vals[i]
+                counts[codes[i]] += 1.0
+        out = vals.copy()
+        for i in range(out.shape[0]):
+            g = codes[i]
+            if np.isnan(out[i]) and counts[g] > 0:
+                out[i] = sums[g] / counts[g]
+        return out
+
+
+def _city_keys(city: pd.Series) -> np.ndarray:
+    """
+    Title-cased City strings used as Salary grouping keys (missing -> 'nan').
+    """
+    # Explicit sentinel so np.unique never sees NaN; object dtype keeps keys whole
+    return city.astype(str).str.title().fillna('nan').to_numpy(dtype=object)
+
+
+def _normalize_city(city: pd.Series) -> np.ndarray:
+    """
+    Title-cases City values; missing or 'nan'/'none' placeholders become ''.
+    """
+    # Title-case through the shared helper, then blank the placeholders on the
+    # (few) cleaned categories; trailing '' slot for missing cities (code -1)
+    city_cat = title_case_categories(city.astype('category'))
+    cats = city_cat.cat.categories.to_numpy(dtype=object)
+    placeholder = pd.Index(cats).str.lower().isin({'nan', 'none', ''})
+    lookup = np.append(np.where(placeholder, '', cats), '')
+    return lookup[city_cat.cat.codes.to_numpy()]
+
+
+def _format_dates(raw_dates: pd.Series) -> np.ndarray:
+    """
+    Parses dates and formats them as YYYY-MM-DD; unparseable values become ''.
+    """
+    try:
+        parsed = pd.to_datetime(raw_dates, errors='coerce', format='ISO8601', cache=True)
+    except ValueError:
+        parsed = None
+    if parsed is None or parsed.isna().sum() > raw_dates.isna().sum():
+        # Some dates are not ISO 8601; re-parse with per-element inference
+        parsed = pd.to_datetime(raw_dates, errors='coerce', format='mixed', cache=True)
+    # Format dates; strftime turns NaT into NaN, which becomes an empty string
+    return parsed.dt.strftime('%Y-%m-%d').fillna('').to_numpy(dtype=object)
+
+
+def _known_complete(df: pd.DataFrame, col: str, stats) -> bool:
+    """
+    True when initial_analysis stats already show numeric column `col` has no
+    missing values, so the fill step can be skipped without rescanning.
+    """
+    return (stats is not None and pd.api.types.is_numeric_dtype(df[col])
+            and not stats['isna'][col].any())
+
+
+def ai_clean(df: pd.DataFrame, stats=None) -> pd.DataFrame:
     """
     Deterministic fallback cleaner that mimics the cleaning steps described in the
     original AI prompt so the pipeline can run without OpenAI/pandasai.
 
+    `stats` is the optional dict returned by data_loader.initial_analysis for
+    the same frame; its missing-value mask lets Age/Salary fills be skipped
+    when those columns are already complete.
+
     Actions performed:
     1. Fill missing 'Age' values with the median age.
     2. Fill missing 'Salary' values with the mean salary for the respective 'City'.
@@ -17,27 +97,47 @@ def ai_clean(df: pd.DataFrame) -> pd.DataFrame:
     """
     print("\nRunning local deterministic data cleaner...")
 
-    # Make a working copy
-    df = df.copy()
+    # Make a working copy (lazy under copy-on-write; columns are replaced, never mutated)
+    df = df.copy(deep=False)
 
     # 1) Fill missing Age with median (numeric only)
-    if 'Age' in df.columns:
+    if 'Age' in df.columns and _known_complete(df, 'Age', stats):
+        df['Age'] = df['Age'].astype(np.int64)
+        print("No missing Age values to fill")
+    elif 'Age' in df.columns:
         try:
-            median_age = pd.to_numeric(df['Age'], errors='coerce').median()
-            df['Age'] = pd.to_numeric(df['Age'], errors='coerce').fillna(median_age).astype(int)
+            age_num = pd.to_numeric(df['Age'], errors='coerce')
+            median_age = age_num.median()
+            df['Age'] = age_num.fillna(median_age).astype(np.int64)
             print(f"Filled missing Age with median: {median_age}")
         except Exception as e:
             print(f"Warning filling Age: {e}")
 
     # 2) Fill missing Salary using mean per City
-    if 'Salary' in df.columns:
+    if 'Salary' in df.columns and _known_complete(df, 'Salary', stats):
+        print("No missing Salary values to fill")
+    elif 'Salary' in df.columns:
         try:
             df['Salary'] = pd.to_numeric(df['Salary'], errors='coerce')
             if 'City' in df.columns:
                 # normalize city temporarily for grouping
-                city_norm = df['City'].astype(str).str.title()
-                salary_by_city = df.groupby(city_norm)['Salary'].transform(lambda x: x.fillna(x.mean()))
-                df['Salary'] = df['Salary'].fillna(salary_by_city)
+                sal = df['Salary'].to_numpy(dtype=np.float64)
+                city = _city_keys(df['City'])
+                keys, inv = np.unique(city, return_inverse=True)
+                if njit is not None:
+                    # single unsorted pass, no argsort needed
+                    df['Salary'] = _group_mean_fill(inv.astype(np.int64), sal, len(keys))
+                else:
+                    # per-city sums/counts in one pass over the city-sorted salaries
+                    order = np.argsort(inv, kind='stable')
+                    sal_sorted = sal[order]
+                    inv_sorted = inv[order]
+                    starts = np.flatnonzero(np.diff(inv_sorted, prepend=-1))
+                    sums = np.add.reduceat(np.nan_to_num(sal_sorted), starts)
+                    counts = np.add.reduceat((~np.isnan(sal_sorted)).astype(np.int64), starts)
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        means = sums / counts
+                    df['Salary'] = np.where(np.isnan(sal), means[inv], sal)
             # Finally, fill any remaining salary with overall mean
             overall_mean = df['Salary'].mean()
             df['Salary'] = df['Salary'].fillna(overall_mean)
@@ -47,16 +147,11 @@ def ai_clean(df: pd.DataFrame) -> pd.DataFrame:
 
     # 3) Normalize City capitalization
     if 'City' in df.columns:
-        df['City'] = df['City'].astype(str).str.strip().replace({'nan': None}).where(~df['City'].astype(str).isin(['None', 'None']), None)
-        df['City'] = df['City'].fillna('').apply(lambda x: x.title() if x != '' else x)
+        df['City'] = _normalize_city(df['City'])
 
     # 4) Normalize Joining_Date to YYYY-MM-DD
     if 'Joining_Date' in df.columns:
-        df['Joining_Date'] = pd.to_datetime(df['Joining_Date'], errors='coerce')
-        # Format dates; keep NaT as empty string or NaN
-        df['Joining_Date'] = df['Joining_Date'].dt.strftime('%Y-%m-%d')
-        # pd.to_datetime + strftime turns NaT into NaN; replace 'NaT' or NaN with empty string
-        df['Joining_Date'] = df['Joining_Date'].fillna('')
+        df['Joining_Date'] = _format_dates(df['Joining_Date'])
 
     # 5) Remove duplicate rows
     before = len(df)
@@ -71,9 +166,123 @@ def ai_clean(df: pd.DataFrame) -> pd.DataFrame:
     # Save cleaned CSV
     output_path = 'data/cleaned/cleaned_dataset.csv'
     try:
-        df.to_csv(output_path, index=False)
+        write_csv(df, output_path)
         print(f"Saved cleaned dataset to {output_path}")
     except Exception as e:
         print(f"Warning saving cleaned dataset: {e}")
 
     return df
+
+
+def ai_clean_chunked(read_chunks, output_path: str = 'data/cleaned/cleaned_dataset.csv') -> int:
+    """
+    Streaming variant of ai_clean for CSVs too large to hold in memory.
+
+    read_chunks is a zero-argument callable returning a fresh iterator of
+    DataFrame chunks, e.g. functools.partial(load_data_chunked, path). It is
+    called twice:
+    1. A statistics pass collects the Age column (for an exact median) and
+       per-City Salary sums/counts, so fills match ai_clean on the full frame.
+       Age is the only column held in full: 8 bytes per row.
+    2. A cleaning pass applies the fills chunk by chunk, drops duplicates
+       across chunks (data_loader.ChunkDeduplicator) and appends to
+       output_path with the same writer as ai_clean.
+
+    Returns the number of rows written.
+    """
+    print("\nRunning local deterministic data cleaner (chunked)...")
+
+    # Pass 1: global statistics
+    ages = []
+    city_sums, city_counts, city_missing = {}, {}, {}
+    for chunk in read_chunks():
+        if 'Age' in chunk.columns:
+            ages.append(pd.to_numeric(chunk['Age'], errors='coerce').to_numpy(dtype=np.float64))
+        if 'Salary' in chunk.columns:
+            sal = pd.to_numeric(chunk['Salary'], errors='coerce').to_numpy(dtype=np.float64)
+            city = _city_keys(chunk['City']) if 'City' in chunk.columns else np.full(len(chunk), '')
+            keys, inv = np.unique(city, return_inverse=True)
+            nan = np.isnan(sal)
+            sums = np.bincount(inv, weights=np.nan_to_num(sal), minlength=len(keys))
+            counts = np.bincount(inv, weights=~nan, minlength=len(keys))
+            missing = np.bincount(inv, weights=nan, minlength=len(keys))
+            for key, total, count, miss in zip(keys, sums, counts, missing):
+                city_sums[key] = city_sums.get(key, 0.0) + total
+                city_counts[key] = city_counts.get(key, 0) + int(count)
+                city_missing[key] = city_missing.get(key, 0) + int(miss)
+
+    median_age = np.nanmedian(np.concatenate(ages)) if ages else np.nan
+    city_means = {k: city_sums[k] / city_counts[k] for k in city_counts if city_counts[k]}
+    # Overall mean is taken after the city fill, as in ai_clean
+    filled = sum(city_missing.get(k, 0) for k in city_means)
+    filled_total = sum(city_missing.get(k, 0) * m for k, m in city_means.items())
+    n_salary = sum(city_counts.values()) + filled
+    overall_mean = (sum(city_sums.values()) + filled_total) / n_salary if n_salary else np.nan
+    if ages and not np.isnan(median_age):
+        print(f"Filled missing Age with median: {median_age}")
+    if city_counts:
+        print(f"Filled missing Salary using city mean and overall mean: {overall_mean}")
+
+    # Pass 2: clean and append chunk by chunk
+    import os
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    dedup = ChunkDeduplicator()
+    written = removed = 0
+    for i, chunk in enumerate(read_chunks()):
+        # Same per-step guards as ai_clean: a failed fill leaves the column as read
+        if 'Age' in chunk.columns:
+            try:
+                chunk['Age'] = pd.to_numeric(chunk['Age'], errors='coerce').fillna(median_age).astype(np.int64)
+            except Exception as e:
+                print(f"Warning filling Age: {e}")
+        if 'Salary' in chunk.columns:
+            try:
+                sal = pd.to_numeric(chunk['Salary'], errors='coerce')
+                if 'City' in chunk.columns:
+                    city_mean = pd.Series(_city_keys(chunk['City']), index=chunk.index).map(city_means)
+                    sal = sal.fillna(city_mean)
+                chunk['Salary'] = sal.fillna(overall_mean)
+            except Exception as e:
+                print(f"Warning filling Salary: {e}")
+        if 'City' in chunk.columns:
+            chunk['City'] = _normalize_city(chunk['City'])
+        if 'Joining_Date' in chunk.columns:
+            chunk['Joining_Date'] = _format_dates(chunk['Joining_Date'])
+
+        # Drop rows already seen in this or an earlier chunk
+        dup = dedup.duplicated(chunk)
+        removed += int(dup.sum())
+        chunk = chunk[~dup]
+
+        write_csv(chunk, output_path, append=i > 0)
+        written += len(chunk)
+
+    print(f"Removed duplicates: {removed}")
+    print(f"Saved cleaned dataset to {output_path}")
+    return written
+
+
+if __name__ == '__main__':
+    # Regression check: cities sharing an initial, plus a missing City, must keep
+    # separate Salary means in both cleaners (reference: pandas groupby mean)
+    import os
+    import tempfile
+    sample = pd.DataFrame({
+        'Name': ['A', 'B', 'C', 'D', 'E'],
+        'Age': [30, 40, 50, 60, 70],
+        'City': ['New York', 'new york', 'Nairobi', 'Nairobi', None],
+        'Salary': [1000.0, np.nan, 9000.0, np.nan, 5000.0],
+    })
+    expected = sample['Salary'].fillna(
+        sample.groupby(sample['City'].str.title(), dropna=False)['Salary'].transform('mean')
+    ).tolist()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            assert ai_clean(sample)['Salary'].tolist() == expected
+            ai_clean_chunked(lambda: (sample.iloc[i:i + 2] for i in range(0, len(sample), 2)), 'chunked.csv')
+            assert pd.read_csv('chunked.csv')['Salary'].tolist() == expected
+        finally:
+            os.chdir(cwd)
+    print(f"\nPer-City Salary fill matches groupby mean: {expected}")
@@ -4,6 +4,14 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from typing import Tuple, Dict, List
 
+try:
+    from .data_loader import title_case_categories
+except ImportError:  # run as a script from this directory
+    from data_loader import title_case_categories
+
+# Leading YYYY-MM-DD / YYYY/MM/DD used to recognise date columns
+DATE_PATTERN = r'^\d{4}[-/]\d{1,2}[-/]\d{1,2}'
+
 
 def perform_eda(df: pd.DataFrame, dataset_name: str = "Dataset") -> Dict:
     """
@@ -30,7 +38,7 @@ def perform_eda(df: pd.DataFrame, dataset_name: str = "Dataset") -> Dict:
     
     # Missing Values
     print(f"\n❌ MISSING VALUES:")
-    missing = df.isnull().sum()
+    missing = df.isna().sum()
     missing_pct = (missing / len(df) * 100).round(2)
     missing_df = pd.DataFrame({'Count': missing, 'Percentage': missing_pct})
     print(missing_df[missing_df['Count'] > 0].to_string() if missing.sum() > 0 else "  No missing values!")
@@ -50,8 +58,15 @@ def perform_eda(df: pd.DataFrame, dataset_name: str = "Dataset") -> Dict:
     numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
     if numeric_cols:
         print(f"\n🔢 NUMERIC COLUMNS SUMMARY:")
-        print(df[numeric_cols].describe().to_string())
-        eda_report['numeric_summary'] = df[numeric_cols].describe().to_dict()
+        agg_spec = {c: ['count', 'mean', 'std', 'min', 'max'] for c in numeric_cols}
+        stats = df.agg(agg_spec)
+        quartiles = df[numeric_cols].quantile([0.25, 0.5, 0.75])
+        quartiles.index = ['25%', '50%', '75%']
+        numeric_summary = pd.concat([stats, quartiles]).loc[
+            ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+        ]
+        print(numeric_summary.to_string())
+        eda_report['numeric_summary'] = numeric_summary.to_dict()
     
     # Categorical Columns
     categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
@@ -75,6 +90,20 @@ def perform_eda(df: pd.DataFrame, dataset_name: str = "Dataset") -> Dict:
     return eda_report
 
 
+def _parse_datetime(series: pd.Series) -> pd.Series:
+    """
+    Parse a column as datetime using the ISO 8601 fast path, falling back to
+    per-element format inference only when some values are not ISO dates.
+    """
+    try:
+        parsed = pd.to_datetime(series, errors='coerce', format='ISO8601', cache=True)
+    except ValueError:
+        parsed = None
+    if parsed is None or parsed.isna().sum() > series.isna().sum():
+        parsed = pd.to_datetime(series, errors='coerce', format='mixed', cache=True)
+    return parsed
+
+
 def detect_column_types(df: pd.DataFrame) -> Dict[str, List[str]]:
     """
     Auto-detect column types and purposes (numeric, date, categorical, text).
@@ -94,16 +123,15 @@ def detect_column_types(df: pd.DataFrame) -> Dict[str, List[str]]:
         elif pd.api.types.is_datetime64_any_dtype(df[col]):
             column_mapping['datetime'].append(col)
         else:
-            # Try to parse as datetime
-            try:
-                pd.to_datetime(df[col], errors='coerce')
-                if df[col].apply(lambda x: isinstance(x, str) and len(x) < 50).all():
-                    column_mapping['datetime'].append(col)
-                else:
-                    column_mapping['text'].append(col)
-            except:
-                # Check if categorical (few unique values)
-                if df[col].nunique() < len(df) * 0.5:
+            # Probe a small sample for date-like strings instead of parsing the column
+            sample = df[col].dropna().astype(str).head(50)
+            looks_date = sample.str.match(DATE_PATTERN).mean() > 0.8
+            if looks_date:
+                column_mapping['datetime'].append(col)
+            else:
+                # Check if categorical (few unique values), estimated on a bounded head
+                head = df[col].head(1000)
+                if head.nunique() < len(head) * 0.5:
                     column_mapping['categorical'].append(col)
                 else:
                     column_mapping['text'].append(col)
@@ -111,10 +139,16 @@ def detect_column_types(df: pd.DataFrame) -> Dict[str, List[str]]:
     return column_mapping
 
 
-def auto_clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
+def auto_clean_dataset(df: pd.DataFrame, duplicates: int = None, missing_counts: Dict = None) -> pd.DataFrame:
     """
     Automatically clean any dataset based on detected column types.
     
+    Args:
+        duplicates: Duplicate row count already computed by perform_eda on
+                    the same frame; when 0 the duplicate scan is skipped.
+        missing_counts: Per-column missing counts from perform_eda on the same
+                        frame; reused as long as no duplicate rows were dropped.
+    
     Actions:
     1. Remove complete duplicate rows
     2. Fill missing numeric values (median for outliers, mean otherwise)
@@ -126,7 +160,7 @@ def auto_clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
     print("AUTOMATIC DATA CLEANING")
     print(f"{'='*60}")
     
-    df = df.copy()
+    df = df.copy(deep=False)  # lazy under copy-on-write
     initial_shape = df.shape
     
     # Detect column types
@@ -137,43 +171,57 @@ def auto_clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
             print(f"  {col_type}: {cols}")
     
     # 1. Remove complete duplicates
-    duplicates_before = df.duplicated().sum()
-    df = df.drop_duplicates(ignore_index=True)
-    duplicates_removed = duplicates_before - df.duplicated().sum()
+    if duplicates == 0:
+        duplicates_removed = 0
+    else:
+        before = len(df)
+        df = df[~df.duplicated().to_numpy()].reset_index(drop=True)
+        duplicates_removed = before - len(df)
     if duplicates_removed > 0:
         print(f"\n✅ Removed {duplicates_removed} duplicate rows")
     
+    # Per-column missing counts in one scan (or straight from perform_eda)
+    if missing_counts is not None and not duplicates_removed:
+        isna_counts = dict(missing_counts)
+    else:
+        isna_counts = df.isna().sum().to_dict()
+    
     # 2. Handle numeric columns
     for col in col_types['numeric']:
-        missing = df[col].isnull().sum()
+        missing = isna_counts[col]
         if missing > 0:
             # Use median for robustness to outliers
             fill_value = df[col].median()
             df[col] = df[col].fillna(fill_value)
+            isna_counts[col] = 0
             print(f"✅ Filled {missing} missing values in '{col}' with median: {fill_value:.2f}")
     
     # 3. Handle categorical columns
     for col in col_types['categorical']:
-        missing = df[col].isnull().sum()
+        missing = isna_counts[col]
         if missing > 0:
             # Fill with mode or 'Unknown'
             mode_val = df[col].mode()
             fill_value = mode_val[0] if len(mode_val) > 0 else 'Unknown'
             df[col] = df[col].fillna(fill_value)
+            isna_counts[col] = 0
             print(f"✅ Filled {missing} missing values in '{col}' with mode: {fill_value}")
         
-        # Standardize text (title case, strip whitespace)
-        if df[col].dtype == 'object':
-            df[col] = df[col].astype(str).str.strip().str.title()
+        # Standardize text (title case, strip whitespace); text loads as the
+        # str dtype rather than object on pandas 3
+        if pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col]):
+            df[col] = title_case_categories(df[col])
     
     # 4. Handle datetime columns
     for col in col_types['datetime']:
-        missing = df[col].isnull().sum()
+        missing = isna_counts[col]
         try:
-            df[col] = pd.to_datetime(df[col], errors='coerce')
+            if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = _parse_datetime(df[col])
             if missing > 0:
                 # Fill with median date or drop rows
                 df[col] = df[col].fillna(df[col].median())
+                isna_counts[col] = 0
                 print(f"✅ Filled {missing} missing dates in '{col}'")
             # Format as string YYYY-MM-DD
             df[col] = df[col].dt.strftime('%Y-%m-%d')
@@ -182,20 +230,23 @@ def auto_clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
     
     # 5. Handle text columns
     for col in col_types['text']:
-        missing = df[col].isnull().sum()
+        missing = isna_counts[col]
         if missing > 0:
             df[col] = df[col].fillna('Unknown')
+            isna_counts[col] = 0
             print(f"✅ Filled {missing} missing values in '{col}' with 'Unknown'")
         # Clean up whitespace
-        if df[col].dtype == 'object':
+        if pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col]):
             df[col] = df[col].astype(str).str.strip()
     
     # Remove rows where majority of columns are missing
-    row_missing_pct = df.isnull().sum(axis=1) / len(df.columns)
-    rows_to_drop = row_missing_pct[row_missing_pct > 0.5].index
-    if len(rows_to_drop) > 0:
-        df = df.drop(rows_to_drop, ignore_index=True)
-        print(f"✅ Removed {len(rows_to_drop)} rows with >50% missing values")
+    na_mat = df.isna().to_numpy()
+    row_missing_pct = na_mat.mean(axis=1)
+    keep = row_missing_pct <= 0.5
+    dropped = int((~keep).sum())
+    if dropped:
+        df = df.iloc[keep].reset_index(drop=True)
+        print(f"✅ Removed {dropped} rows with >50% missing values")
     
     final_shape = df.shape
     print(f"\n📊 Summary:")
@@ -206,6 +257,17 @@ def auto_clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _box_stats(values: pd.Series, label: str) -> Dict:
+    """
+    Box-plot statistics for Axes.bxp, computed with one np.quantile call so
+    matplotlib does not re-sort the data. Whiskers span min to max.
+    """
+    arr = values.to_numpy(dtype=np.float64)
+    q = np.quantile(arr, [0, 0.25, 0.5, 0.75, 1.0]) if arr.size else np.full(5, np.nan)
+    return {'label': label, 'whislo': q[0], 'q1': q[1], 'med': q[2],
+            'q3': q[3], 'whishi': q[4], 'fliers': []}
+
+
 def create_eda_visualizations(df_before: pd.DataFrame, df_after: pd.DataFrame, output_path: str = "reports/eda_analysis.png"):
     """
     Create comprehensive EDA visualizations comparing before and after cleaning.
@@ -232,11 +294,12 @@ def create_eda_visualizations(df_before: pd.DataFrame, df_after: pd.DataFrame, o
     for idx, col in enumerate(numeric_cols[:4]):
         ax = axes[idx]
         
-        # Create box plot comparison
+        # Create box plot comparison from precomputed quartiles
         data_before = df_before[col].dropna()
         data_after = df_after[col].dropna()
         
-        bp = ax.boxplot([data_before, data_after], labels=['Before', 'After'], patch_artist=True)
+        stats = [_box_stats(data_before, 'Before'), _box_stats(data_after, 'After')]
+        bp = ax.bxp(stats, patch_artist=True)
         for patch, color in zip(bp['boxes'], ['lightcoral', 'lightgreen']):
             patch.set_facecolor(color)
         
@@ -245,6 +308,6 @@ def create_eda_visualizations(df_before: pd.DataFrame, df_after: pd.DataFrame, o
         ax.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.savefig(output_path, dpi=150, bbox_inches='tight')
     print(f"✅ Visualization saved to {output_path}")
     plt.close()
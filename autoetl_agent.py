@@ -1,11 +1,13 @@
 import os
-from src.data_loader import load_data, initial_analysis
+from functools import partial
+from src.data_loader import LARGE_FILE_BYTES, load_data, load_data_chunked, initial_analysis
 try:
     from src.ai_cleaner import ai_clean
 except Exception:
     # Fallback to a local deterministic cleaner if pandasai/OpenAI isn't available
     from src.ai_cleaner_local import ai_clean
     print("Using local deterministic ai_clean (fallback, no OpenAI available).")
+from src.ai_cleaner_local import ai_clean_chunked
 from src.summarizer import summarize_cleaning
 
 def run_autoetl():
@@ -17,6 +19,17 @@ def run_autoetl():
     # Define file path
     raw_data_path = "data/raw/messy_dataset.csv"
     
+    # Files too large to load at once are streamed through the local cleaner
+    if os.path.exists(raw_data_path) and os.path.getsize(raw_data_path) > LARGE_FILE_BYTES:
+        try:
+            ai_clean_chunked(partial(load_data_chunked, raw_data_path))
+        except Exception as e:
+            print(f"An error occurred during the AI cleaning process: {e}")
+            print("ETL process halted.")
+            return
+        print("\nAutoETL pipeline completed successfully! (summary skipped for streamed input)")
+        return
+    
     # Step 1: Load raw data
     original_df = load_data(raw_data_path)
     
@@ -25,11 +38,11 @@ def run_autoetl():
         return
 
     # Perform initial analysis
-    initial_analysis(original_df)
+    stats = initial_analysis(original_df)
     
     # Step 2: Clean data via AI agent
     try:
-        cleaned_df = ai_clean(original_df.copy()) # Pass a copy to keep the original intact
+        cleaned_df = ai_clean(original_df, stats=stats) # Cleaners work on a copy-on-write copy; the original stays intact
     except Exception as e:
         print(f"An error occurred during the AI cleaning process: {e}")
         print("ETL process halted.")
@@ -1,30 +1,154 @@
+import numpy as np
 import pandas as pd
 
+# The cleaners take shallow df.copy(deep=False) working copies and replace
+# columns on them; copy-on-write keeps the caller's frame untouched. It is
+# always on (and the option deprecated) from pandas 3.0. Set here because
+# every cleaner imports this module.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional: fall back to DataFrame.to_csv
+    pa = None
+
+# Inputs above this size are streamed in chunks instead of loaded whole
+LARGE_FILE_BYTES = 100 * 1024 * 1024
+
 def load_data(file_path):
     """
     Loads a CSV file into a pandas DataFrame and prints basic info.
     """
     print(f"Loading data from {file_path}...")
     try:
-        df = pd.read_csv(file_path)
+        try:
+            # Multi-threaded Arrow parser; needs pyarrow installed
+            df = pd.read_csv(file_path, engine='pyarrow')
+        except ImportError:
+            df = pd.read_csv(file_path)
         print("Data loaded successfully.")
         return df
     except FileNotFoundError:
         print(f"Error: The file at {file_path} was not found.")
         return None
 
+def load_data_chunked(file_path, chunksize=100_000):
+    """
+    Yields the CSV as DataFrames of at most `chunksize` rows so large files
+    never have to fit in memory at once.
+    """
+    print(f"Streaming data from {file_path} in chunks of {chunksize} rows...")
+    try:
+        # The pyarrow engine does not support chunksize; use the C parser
+        yield from pd.read_csv(file_path, chunksize=chunksize, engine='c')
+    except FileNotFoundError:
+        print(f"Error: The file at {file_path} was not found.")
+
+def write_csv(df, output_path, append=False):
+    """
+    Writes df as CSV with pyarrow's multi-threaded writer, falling back to
+    DataFrame.to_csv when pyarrow is missing or cannot convert a column.
+    Frames with datetime or bool columns also go through to_csv: Arrow would
+    write them as '2021-03-15 00:00:00.000000' and 'true'/'false'.
+    With append=True the rows are added to output_path without a header,
+    so streamed chunks come out formatted like a single in-memory write.
+    """
+    if pa is not None and not len(df.select_dtypes(include=['datetime', 'datetimetz', 'bool']).columns):
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except pa.ArrowException:
+            table = None
+        if table is not None:
+            options = pacsv.WriteOptions(include_header=not append, quoting_style='needed')
+            with open(output_path, 'ab' if append else 'wb') as f:
+                pacsv.write_csv(table, f, options)
+            return
+    df.to_csv(output_path, mode='a' if append else 'w', header=not append, index=False)
+
+class ChunkDeduplicator:
+    """
+    Flags rows of a streamed CSV that repeat a row from this or an earlier
+    chunk, like DataFrame.duplicated() over the whole file.
+
+    Rows are keyed by 64-bit hashes (numeric columns hashed as float64 so a
+    column parsed as int in one chunk and float in another still matches).
+    Seen hashes are kept in sorted runs that merge like a binary counter, so
+    each hash is re-sorted O(log n) times overall rather than once per chunk.
+    Memory is 8 bytes per distinct row.
+    """
+
+    def __init__(self):
+        self._runs = []
+
+    def duplicated(self, chunk):
+        """
+        Returns a boolean mask of the duplicate rows in chunk and records the
+        rest as seen.
+        """
+        numeric = chunk.select_dtypes(include='number').columns
+        keys = chunk.astype({col: 'float64' for col in numeric}) if len(numeric) else chunk
+        hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+        dup = pd.Series(hashes).duplicated().to_numpy(copy=True)
+        # Probe the runs with sorted hashes: searchsorted walks memory in order
+        order = np.argsort(hashes)
+        probe = hashes[order]
+        seen = np.zeros(len(probe), dtype=bool)
+        for run in self._runs:
+            pos = np.minimum(np.searchsorted(run, probe), len(run) - 1)
+            seen |= run[pos] == probe
+        dup[order[seen]] = True
+        new = probe[~seen & ~dup[order]]
+        # Merge equal-or-smaller runs first so there are only O(log n) of them
+        while self._runs and len(self._runs[-1]) <= len(new):
+            new = np.sort(np.concatenate([self._runs.pop(), new]), kind='stable')
+        if len(new):
+            self._runs.append(new)
+        return dup
+
+def title_case_categories(series):
+    """
+    Strips and title-cases a low-cardinality column by normalizing only its
+    distinct values, then mapping them back to rows through the category
+    codes. Missing values stay missing and the name is kept; categorical
+    input stays categorical, anything else keeps its dtype. The column is
+    returned untouched when every distinct value is already clean.
+    """
+    col_cat = series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype('category')
+    cats = col_cat.cat.categories
+    new_cats = cats.astype(str).str.strip().str.title()
+    if new_cats.equals(cats):
+        return series
+    codes = col_cat.cat.codes.to_numpy()
+    if col_cat is series:
+        # Re-factorize the cleaned categories and remap the codes, since
+        # stripping can merge categories (rename_categories rejects that)
+        remap, merged = pd.factorize(new_cats)
+        new_codes = np.where(codes >= 0, remap[codes], -1)
+        return pd.Series(pd.Categorical.from_codes(new_codes, merged), index=series.index, name=series.name)
+    # Lookup with a trailing missing slot for code -1, in the column's own dtype
+    lookup = pd.array(new_cats.tolist() + [np.nan], dtype=series.dtype)
+    return pd.Series(lookup.take(codes), index=series.index, name=series.name, dtype=series.dtype)
+
 def initial_analysis(df):
     """
     Performs an initial analysis of the DataFrame.
+
+    Returns a dict with the missing-value mask ('isna') and duplicate row
+    count ('dup_count') so the cleaners can reuse them instead of rescanning.
     """
     if df is not None:
+        isna = df.isna()
+        dup_count = df.duplicated().sum()
         print("\nInitial DataFrame info:")
         df.info()
         print("\nInitial DataFrame head:")
         print(df.head())
         print("\nMissing values before cleaning:")
-        print(df.isnull().sum())
-        print(f"\nNumber of duplicate rows before cleaning: {df.duplicated().sum()}")
+        print(isna.sum())
+        print(f"\nNumber of duplicate rows before cleaning: {dup_count}")
+        return {'isna': isna, 'dup_count': dup_count}
 
 if __name__ == '__main__':
     # This block is for testing the data_loader module directly
@@ -35,14 +35,73 @@ RUN:
 """
 
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # headless: figures are only written to disk
 import matplotlib.pyplot as plt
 import seaborn as sns
 from typing import Dict, List, Tuple
 
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional: fall back to the C parser and object strings
+    pa = None
+
+try:
+    from .data_loader import LARGE_FILE_BYTES, ChunkDeduplicator, title_case_categories, write_csv
+except ImportError:  # run as a script from this directory
+    from data_loader import LARGE_FILE_BYTES, ChunkDeduplicator, title_case_categories, write_csv
+
+
+# Rows sampled per column when probing for datetimes
+_DATETIME_SAMPLE = 10_000
+
+# Cheap pre-check (run on 100 values) before attempting to parse a column as dates
+DATE_PROBE = re.compile(r'^\s*\d{2,4}[-/]\d{1,2}[-/]\d{1,4}')
+
+# Files above LARGE_FILE_BYTES are cleaned in streamed chunks of this many rows
+_CHUNK_ROWS = 200_000
+# Values per column kept for the streamed medians (exact below this count)
+_STREAM_SAMPLE = 200_000
+
+# Worker threads for the per-column cleaning steps
+_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+class _StreamSample:
+    """
+    Fixed-size uniform sample of a column streamed in chunks (bottom-k random
+    keys), used for medians with bounded memory. Holds every value, so the
+    median is exact, until more than `size` values have been added.
+    """
+    
+    def __init__(self, size: int = _STREAM_SAMPLE, seed: int = 0):
+        self.size = size
+        self._rng = np.random.default_rng(seed)
+        self._keys = np.empty(0)
+        self._values = None
+    
+    def add(self, values: np.ndarray):
+        keys = np.concatenate([self._keys, self._rng.random(len(values))])
+        values = values if self._values is None else np.concatenate([self._values, values])
+        if len(keys) > self.size:
+            keep = np.argpartition(keys, self.size)[:self.size]
+            keys, values = keys[keep], values[keep]
+        self._keys, self._values = keys, values
+    
+    def median(self):
+        return pd.Series(self._values).median() if self._values is not None and len(self._values) else None
+
 
 class IntelligentDataCleaner:
     """Universal data cleaning engine - works with any CSV structure"""
@@ -50,18 +109,26 @@ class IntelligentDataCleaner:
     def __init__(self, verbose=True):
         self.verbose = verbose
         self.col_types = {}
+        self.datetime_formats = {}
         self.eda_report = {}
+        # Per-column missing counts, kept with the frame they were computed on
+        self.missing_before = None
+        self.missing_after = None
+        self._missing_frames = (None, None)
         
     def log(self, msg):
         """Print verbose messages"""
         if self.verbose:
             print(msg)
     
-    def load_data(self, filepath: str) -> pd.DataFrame:
-        """Load CSV file"""
+    def load_data(self, filepath: str, engine: str = 'pyarrow', dtype_backend: str = None) -> pd.DataFrame:
+        """Load CSV file (multi-threaded pyarrow parser when available)"""
         self.log(f"\n📂 Loading data from: {filepath}")
         try:
-            df = pd.read_csv(filepath)
+            kwargs = {'dtype_backend': dtype_backend} if dtype_backend else {}
+            if engine == 'pyarrow' and pa is None:
+                engine = 'c'
+            df = pd.read_csv(filepath, engine=engine, **kwargs)
             self.log(f"✅ Data loaded successfully ({df.shape[0]} rows, {df.shape[1]} columns)")
             return df
         except Exception as e:
@@ -87,19 +154,21 @@ class IntelligentDataCleaner:
             elif pd.api.types.is_datetime64_any_dtype(df[col]):
                 col_types['datetime'].append(col)
             else:
-                # Try to parse as datetime
-                try:
-                    pd.to_datetime(df[col], errors='coerce')
-                    if df[col].apply(lambda x: isinstance(x, str) and len(str(x)) < 50).all():
-                        col_types['datetime'].append(col)
-                    else:
-                        col_types['text'].append(col)
-                except:
-                    # Check if categorical (few unique values)
-                    if df[col].nunique() < len(df) * 0.5:
-                        col_types['categorical'].append(col)
-                    else:
-                        col_types['text'].append(col)
+                # Try to parse as datetime, on a bounded sample only, and only
+                # when most of the first values look like dates
+                sample = df[col].dropna().head(_DATETIME_SAMPLE)
+                looks_like_date = sample.head(100).astype(str).str.match(DATE_PROBE).mean() >= 0.5
+                parsed = pd.to_datetime(sample, errors='coerce', format='mixed') if looks_like_date else None
+                if looks_like_date and parsed.notna().mean() > 0.9:
+                    col_types['datetime'].append(col)
+                    # Remember the format so clean_data can skip inference
+                    self.datetime_formats.pop(col, None)
+                    self._datetime_format(df[col], col, sample, parsed)
+                # Check if categorical (few unique values)
+                elif df[col].nunique() < len(df) * 0.5:
+                    col_types['categorical'].append(col)
+                else:
+                    col_types['text'].append(col)
         
         self.col_types = col_types
         self.log("✅ Column types detected:")
@@ -109,6 +178,45 @@ class IntelligentDataCleaner:
         
         return col_types
     
+    def optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Downcast numeric columns and store categorical strings as category (after detect_column_types)"""
+        before = df.memory_usage(deep=True).sum() if self.verbose else 0
+        df = df.copy(deep=False)
+        
+        for col in self.col_types.get('numeric', []):
+            if pd.api.types.is_bool_dtype(df[col]):
+                continue
+            if pd.api.types.is_integer_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+            else:
+                # Only keep float32 when it holds every value exactly
+                down = pd.to_numeric(df[col], downcast='float')
+                if down.dtype != df[col].dtype and np.array_equal(
+                        down.to_numpy(dtype=np.float64), df[col].to_numpy(dtype=np.float64), equal_nan=True):
+                    df[col] = down
+        
+        cat_cols = df[self.col_types.get('categorical', [])].select_dtypes(include=['object', 'string']).columns
+        if len(cat_cols) > 0:
+            df[cat_cols] = df[cat_cols].astype('category')
+        
+        if self.verbose:
+            after = df.memory_usage(deep=True).sum()
+            self.log(f"\n🗜️  Optimized dtypes: {before / 1024**2:.2f} MB → {after / 1024**2:.2f} MB")
+        return df
+    
+    def _datetime_format(self, series: pd.Series, col: str, sample: pd.Series = None, parsed: pd.Series = None):
+        """Guess a column's datetime format once; 'mixed' (per-value inference) if no single format fits"""
+        if col not in self.datetime_formats:
+            if sample is None:
+                sample = series.dropna().head(_DATETIME_SAMPLE)
+                parsed = pd.to_datetime(sample, errors='coerce', format='mixed')
+            fmt = guess_datetime_format(str(sample.iloc[0])) if len(sample) > 0 else None
+            if fmt and pd.to_datetime(sample, errors='coerce', format=fmt).notna().sum() < parsed.notna().sum():
+                fmt = None
+            # format=None would infer one format from the first value and coerce the rest to NaT
+            self.datetime_formats[col] = fmt or 'mixed'
+        return self.datetime_formats[col]
+    
     def perform_eda(self, df: pd.DataFrame, name: str = "Dataset") -> Dict:
         """Perform exploratory data analysis"""
         self.log(f"\n{'='*60}")
@@ -131,6 +239,8 @@ class IntelligentDataCleaner:
         else:
             self.log("   None!")
         report['missing'] = missing.to_dict()
+        self.missing_before = missing
+        self._missing_frames = (df, self._missing_frames[1])
         
         # Duplicates
         duplicates = df.duplicated().sum()
@@ -141,8 +251,9 @@ class IntelligentDataCleaner:
         numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
         if numeric_cols:
             self.log(f"\n🔢 NUMERIC COLUMNS:")
-            for col in numeric_cols:
-                self.log(f"   {col}: mean={df[col].mean():.2f}, min={df[col].min():.2f}, max={df[col].max():.2f}")
+            stats = df[numeric_cols].agg(['mean', 'min', 'max']).T
+            for col, row in stats.iterrows():
+                self.log(f"   {col}: mean={row['mean']:.2f}, min={row['min']:.2f}, max={row['max']:.2f}")
         
         # Data quality score
         quality_score = (1 - (missing.sum() / (len(df) * len(df.columns)))) * 100
@@ -161,63 +272,116 @@ class IntelligentDataCleaner:
         self.log(f"🧹 AUTOMATIC DATA CLEANING")
         self.log(f"{'='*60}")
         
-        df = df.copy()
+        # Counts from perform_eda stay valid until rows are removed
+        from_eda = df is self._missing_frames[0]
+        missing_counts = self.missing_before if from_eda else None
+        df = df.copy(deep=False)  # lazy under copy-on-write
         initial_rows = len(df)
         
-        # 1. Remove duplicates
-        duplicates = df.duplicated().sum()
-        df = df.drop_duplicates(ignore_index=True)
-        if duplicates > 0:
-            self.log(f"✅ Removed {duplicates} duplicate rows")
+        # 1. Remove duplicates (one mask, no scan at all if perform_eda found none)
+        if not (from_eda and self.eda_report.get('duplicates') == 0):
+            hash_subset = self.col_types['numeric'] + self.col_types['categorical']
+            if hash_subset and len(hash_subset) < df.shape[1]:
+                # Full duplicates must also match on the cheap-to-hash numeric and
+                # categorical columns, so only those candidate rows get a full-row hash
+                candidates = df.duplicated(subset=hash_subset, keep=False).to_numpy()
+                dup_mask = np.zeros(len(df), dtype=bool)
+                if candidates.any():
+                    dup_mask[candidates] = df.loc[candidates].duplicated().to_numpy()
+            else:
+                dup_mask = df.duplicated().to_numpy()
+            duplicates = int(dup_mask.sum())
+            if duplicates > 0:
+                df = df.loc[~dup_mask].reset_index(drop=True)
+                self.log(f"✅ Removed {duplicates} duplicate rows")
+                missing_counts = None
+        if missing_counts is None:
+            missing_counts = df.isna().sum()
+        
+        # Move string columns to Arrow-backed strings in one call so the
+        # .str normalisation below runs in Arrow compute kernels; category
+        # columns (from optimize_dtypes) are normalised on their categories
+        str_cols = df[self.col_types['categorical'] + self.col_types['text']].select_dtypes(
+            include=['object', 'string']).columns.tolist()
+        if str_cols:
+            df[str_cols] = df[str_cols].astype('string[pyarrow]' if pa is not None else 'string')
+        cat_dtype_cols = df[self.col_types['categorical']].select_dtypes(include='category').columns.tolist()
         
-        # 2. Handle numeric columns
-        for col in self.col_types['numeric']:
-            missing = df[col].isnull().sum()
-            if missing > 0:
-                fill_val = df[col].median()
-                df[col] = df[col].fillna(fill_val)
-                self.log(f"✅ Filled {missing} missing in '{col}' with median: {fill_val:.2f}")
-        
-        # 3. Handle categorical columns
-        for col in self.col_types['categorical']:
-            missing = df[col].isnull().sum()
-            if missing > 0:
-                mode_val = df[col].mode()
-                fill_val = mode_val[0] if len(mode_val) > 0 else 'Unknown'
-                df[col] = df[col].fillna(fill_val)
-                self.log(f"✅ Filled {missing} missing in '{col}' with: {fill_val}")
-            # Standardize text
-            if df[col].dtype == 'object':
-                df[col] = df[col].astype(str).str.strip().str.title()
+        # 2. Handle numeric columns (one median + fillna across all of them)
+        num_missing = missing_counts[self.col_types['numeric']]
+        num_missing = num_missing[num_missing > 0]
+        if len(num_missing) > 0:
+            cols = num_missing.index.tolist()
+            medians = df[cols].median(numeric_only=True)
+            df[cols] = df[cols].fillna(medians)
+            for col, missing in num_missing.items():
+                self.log(f"✅ Filled {missing} missing in '{col}' with median: {medians[col]:.2f}")
+        
+        # 3. Handle categorical columns (modes computed in one call)
+        cat_missing = missing_counts[self.col_types['categorical']]
+        cat_missing = cat_missing[cat_missing > 0]
+        if len(cat_missing) > 0:
+            cols = cat_missing.index.tolist()
+            modes = df[cols].mode()
+            modes = modes.iloc[0] if len(modes) > 0 else pd.Series(index=cols, dtype=object)
+            modes = modes.fillna('Unknown')
+            for col in cols:
+                if col in cat_dtype_cols and modes[col] not in df[col].cat.categories:
+                    df[col] = df[col].cat.add_categories([modes[col]])
+            df[cols] = df[cols].fillna(modes)
+            for col, missing in cat_missing.items():
+                self.log(f"✅ Filled {missing} missing in '{col}' with: {modes[col]}")
+        # Standardize categorical text
+        def title_case(col, series):
+            return title_case_categories(series), None
         
         # 4. Handle datetime columns
-        for col in self.col_types['datetime']:
+        def clean_datetime(col, series):
             try:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-                missing = df[col].isnull().sum()
-                if missing > 0:
-                    df[col] = df[col].fillna(df[col].median())
-                df[col] = df[col].dt.strftime('%Y-%m-%d')
+                if not pd.api.types.is_datetime64_any_dtype(series):
+                    fmt = self._datetime_format(series, col)
+                    series = pd.to_datetime(series, errors='coerce', format=fmt, cache=True)
+                missing = series.isnull().sum()
                 if missing > 0:
-                    self.log(f"✅ Parsed and filled {missing} dates in '{col}'")
-            except:
-                self.log(f"⚠️  Could not parse '{col}' as datetime")
+                    series = series.fillna(series.median())
+                series = series.dt.strftime('%Y-%m-%d')
+                return series, (f"✅ Parsed and filled {missing} dates in '{col}'" if missing > 0 else None)
+            except Exception:
+                return None, f"⚠️  Could not parse '{col}' as datetime"
         
         # 5. Handle text columns
-        for col in self.col_types['text']:
-            missing = df[col].isnull().sum()
-            if missing > 0:
-                df[col] = df[col].fillna('Unknown')
-                self.log(f"✅ Filled {missing} missing in '{col}' with 'Unknown'")
-            if df[col].dtype == 'object':
-                df[col] = df[col].astype(str).str.strip()
+        def clean_text(col, series):
+            msg = None
+            if missing_counts[col] > 0:
+                series = series.fillna('Unknown')
+                msg = f"✅ Filled {missing_counts[col]} missing in '{col}' with 'Unknown'"
+            if col in str_cols:
+                series = series.str.strip()
+            return series, msg
+        
+        # Columns are independent, so steps 3-5 run on a thread pool (the
+        # Arrow/numpy kernels release the GIL); results are applied in order
+        jobs = ([(col, title_case) for col in self.col_types['categorical'] if col in str_cols or col in cat_dtype_cols]
+                + [(col, clean_datetime) for col in self.col_types['datetime']]
+                + [(col, clean_text) for col in self.col_types['text']])
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+            results = list(pool.map(lambda job, series: job[1](job[0], series), jobs, [df[col] for col, _ in jobs]))
+        for (col, _), (series, msg) in zip(jobs, results):
+            if series is not None:
+                df[col] = series
+            if msg:
+                self.log(msg)
         
         # 6. Remove rows with >50% missing
-        row_missing = df.isnull().sum(axis=1) / len(df.columns)
-        rows_drop = row_missing[row_missing > 0.5].index
-        if len(rows_drop) > 0:
-            df = df.drop(rows_drop, ignore_index=True)
-            self.log(f"✅ Removed {len(rows_drop)} rows with >50% missing values")
+        isna_mat = df.isna().values
+        row_frac = isna_mat.mean(axis=1)
+        keep = row_frac <= 0.5
+        rows_drop = int((~keep).sum())
+        if rows_drop > 0:
+            df = df.loc[keep].reset_index(drop=True)
+            self.log(f"✅ Removed {rows_drop} rows with >50% missing values")
+        self.missing_after = pd.Series(isna_mat[keep].sum(axis=0), index=df.columns)
+        self._missing_frames = (self._missing_frames[0], df)
         
         self.log(f"\n📊 SUMMARY:")
         self.log(f"   Before: {initial_rows} rows")
@@ -226,11 +390,126 @@ class IntelligentDataCleaner:
         
         return df
     
+    def clean_file_chunked(self, filepath: str, output_path: str, chunksize: int = _CHUNK_ROWS) -> int:
+        """
+        Clean a CSV too large to load at once, streaming it in two passes:
+        1. Drop duplicates across chunks (ChunkDeduplicator) and collect the
+           global modes and medians over the remaining rows.
+        2. Apply the same fills and normalisation as clean_data chunk by
+           chunk, appending to output_path with the same CSV writer.
+        Medians come from a _STREAM_SAMPLE-value sample per numeric/datetime
+        column, so they are exact up to that many values and approximate
+        beyond. Memory still grows with the row count: the deduplicator holds
+        8 bytes per distinct row (plus O(log n) temporary merge copies) and
+        the per-chunk duplicate masks 1 byte per row.
+        Column types must already be detected (e.g. on the first chunk).
+        Returns the number of rows written.
+        """
+        self.log(f"\n{'='*60}")
+        self.log(f"🧹 AUTOMATIC DATA CLEANING (streaming, {chunksize} rows per chunk)")
+        self.log(f"{'='*60}")
+        
+        numeric, categorical = self.col_types['numeric'], self.col_types['categorical']
+        datetime_cols, text = self.col_types['datetime'], self.col_types['text']
+        
+        # Pass 1: duplicate masks and global statistics
+        dedup = ChunkDeduplicator()
+        dup_masks = []
+        missing_counts = None
+        num_samples = {col: _StreamSample() for col in numeric}
+        cat_counts = {col: pd.Series(dtype='int64') for col in categorical}
+        date_samples = {col: _StreamSample() for col in datetime_cols}
+        initial_rows = 0
+        for chunk in pd.read_csv(filepath, chunksize=chunksize):
+            initial_rows += len(chunk)
+            dup = dedup.duplicated(chunk)
+            dup_masks.append(dup)
+            chunk = chunk[~dup]
+            
+            counts = chunk.isna().sum()
+            missing_counts = counts if missing_counts is None else missing_counts + counts
+            for col in numeric:
+                values = pd.to_numeric(chunk[col], errors='coerce').dropna()
+                num_samples[col].add(values.to_numpy(dtype=np.float64))
+            for col in categorical:
+                cat_counts[col] = cat_counts[col].add(chunk[col].value_counts(), fill_value=0)
+            for col in datetime_cols:
+                parsed = pd.to_datetime(chunk[col], errors='coerce', format=self._datetime_format(chunk[col], col), cache=True)
+                date_samples[col].add(parsed.dropna().to_numpy(dtype='datetime64[ns]'))
+        
+        duplicates = int(sum(mask.sum() for mask in dup_masks))
+        if duplicates > 0:
+            self.log(f"✅ Removed {duplicates} duplicate rows")
+        
+        medians = {}
+        for col in numeric:
+            median = num_samples[col].median()
+            medians[col] = np.nan if median is None else median
+            if missing_counts[col] > 0:
+                self.log(f"✅ Filled {missing_counts[col]} missing in '{col}' with median: {medians[col]:.2f}")
+        modes = {}
+        for col in categorical:
+            counts = cat_counts[col]
+            # Ties resolve to the smallest value, as DataFrame.mode does
+            modes[col] = counts[counts == counts.max()].sort_index().index[0] if len(counts) else 'Unknown'
+            if missing_counts[col] > 0:
+                self.log(f"✅ Filled {missing_counts[col]} missing in '{col}' with: {modes[col]}")
+        date_medians = {}
+        for col in datetime_cols:
+            median = date_samples[col].median()
+            date_medians[col] = pd.NaT if median is None else median
+        for col in text:
+            if missing_counts[col] > 0:
+                self.log(f"✅ Filled {missing_counts[col]} missing in '{col}' with 'Unknown'")
+        
+        # Pass 2: clean each chunk and append it to the output
+        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
+        written = rows_drop = 0
+        for i, chunk in enumerate(pd.read_csv(filepath, chunksize=chunksize)):
+            chunk = chunk[~dup_masks[i]]
+            
+            str_cols = chunk[categorical + text].select_dtypes(include=['object', 'string']).columns.tolist()
+            if str_cols:
+                chunk[str_cols] = chunk[str_cols].astype('string[pyarrow]' if pa is not None else 'string')
+            
+            if numeric:
+                chunk[numeric] = chunk[numeric].apply(pd.to_numeric, errors='coerce').fillna(medians)
+            if categorical:
+                chunk[categorical] = chunk[categorical].fillna(modes)
+            for col in categorical:
+                if col in str_cols:
+                    chunk[col] = title_case_categories(chunk[col])
+            for col in datetime_cols:
+                parsed = pd.to_datetime(chunk[col], errors='coerce', format=self._datetime_format(chunk[col], col), cache=True)
+                chunk[col] = parsed.fillna(date_medians[col]).dt.strftime('%Y-%m-%d')
+            for col in text:
+                chunk[col] = chunk[col].fillna('Unknown')
+                if col in str_cols:
+                    chunk[col] = chunk[col].str.strip()
+            
+            keep = chunk.isna().values.mean(axis=1) <= 0.5
+            rows_drop += int((~keep).sum())
+            chunk = chunk.loc[keep]
+            
+            write_csv(chunk, output_path, append=i > 0)
+            written += len(chunk)
+        
+        if rows_drop > 0:
+            self.log(f"✅ Removed {rows_drop} rows with >50% missing values")
+        
+        self.log(f"\n📊 SUMMARY:")
+        self.log(f"   Before: {initial_rows} rows")
+        self.log(f"   After:  {written} rows")
+        self.log(f"   Removed: {initial_rows - written} rows")
+        self.log(f"\n💾 Cleaned dataset saved to: {output_path}")
+        
+        return written
+    
     def save_results(self, df: pd.DataFrame, output_path: str) -> bool:
         """Save cleaned dataset"""
         try:
             os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
-            df.to_csv(output_path, index=False)
+            write_csv(df, output_path)
             self.log(f"\n💾 Cleaned dataset saved to: {output_path}")
             return True
         except Exception as e:
@@ -262,18 +541,25 @@ class IntelligentDataCleaner:
                 data_before = df_before[col].dropna()
                 data_after = df_after[col].dropna()
                 
-                bp = ax.boxplot([data_before, data_after], labels=['Before', 'After'], patch_artist=True)
+                ax.set_title(f'{col}')
+                if np.array_equal(np.sort(data_before.to_numpy()), np.sort(data_after.to_numpy())):
+                    # Cleaning left the distribution unchanged, nothing to compare
+                    ax.text(0.5, 0.5, 'Unchanged', ha='center', va='center', transform=ax.transAxes)
+                    ax.set_xticks([])
+                    continue
+                
+                bp = ax.boxplot([data_before, data_after], patch_artist=True)
                 for patch, color in zip(bp['boxes'], ['lightcoral', 'lightgreen']):
                     patch.set_facecolor(color)
+                ax.set_xticks([1, 2], ['Before', 'After'])
                 
-                ax.set_title(f'{col}')
                 ax.set_ylabel('Value')
                 ax.grid(True, alpha=0.3)
             
-            plt.tight_layout()
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            fig.tight_layout()
+            fig.savefig(output_path, dpi=150, bbox_inches='tight')
             self.log(f"✅ Visualization saved to: {output_path}")
-            plt.close()
+            plt.close(fig)
             return True
         except Exception as e:
             self.log(f"⚠️  Could not create visualization: {e}")
@@ -295,12 +581,18 @@ class IntelligentDataCleaner:
                 f.write(f"Rows Removed: {df_before.shape[0] - df_after.shape[0]}\n\n")
                 
                 f.write("Missing Values Before:\n")
-                missing_before = df_before.isnull().sum()
+                if df_before is self._missing_frames[0]:
+                    missing_before = self.missing_before
+                else:
+                    missing_before = df_before.isnull().sum()
                 for col in missing_before[missing_before > 0].index:
                     f.write(f"  {col}: {missing_before[col]}\n")
                 
                 f.write("\nMissing Values After:\n")
-                missing_after = df_after.isnull().sum()
+                if df_after is self._missing_frames[1]:
+                    missing_after = self.missing_after
+                else:
+                    missing_after = df_after.isnull().sum()
                 if missing_after.sum() == 0:
                     f.write("  None!\n")
                 else:
@@ -344,13 +636,24 @@ EXAMPLES:
     # Initialize cleaner
     cleaner = IntelligentDataCleaner(verbose=True)
     
+    # Stream files too large to hold in memory; types come from the first chunk
+    if not args.eda_only and os.path.getsize(args.input) > LARGE_FILE_BYTES:
+        cleaner.log(f"\n📂 Streaming large file: {args.input}")
+        cleaner.detect_column_types(next(pd.read_csv(args.input, chunksize=_CHUNK_ROWS)))
+        output_path = args.output or f"{os.path.splitext(args.input)[0]}_cleaned.csv"
+        cleaner.clean_file_chunked(args.input, output_path)
+        cleaner.log(f"\n✅ CLEANING COMPLETE! (report and visualization skipped for streamed files)")
+        cleaner.log(f"   • Cleaned CSV: {output_path}")
+        return True
+    
     # Load data
     df_original = cleaner.load_data(args.input)
     if df_original is None:
         return False
     
-    # Detect column types
+    # Detect column types, then shrink the frame to the smallest dtypes
     cleaner.detect_column_types(df_original)
+    df_original = cleaner.optimize_dtypes(df_original)
     
     # Perform EDA
     cleaner.perform_eda(df_original, os.path.basename(args.input))
@@ -28,7 +28,7 @@ except Exception:
 from src.summarizer import summarize_cleaning
 
 
-def run_autoetl_custom(input_path, output_path=None, eda_only=False, use_ai=False):
+def run_autoetl_custom(input_path, output_path=None, eda_only=False, use_ai=False, verbose=False):
     """
     Orchestrates the intelligent AutoETL pipeline for any dataset.
     
@@ -38,6 +38,7 @@ def run_autoetl_custom(input_path, output_path=None, eda_only=False, use_ai=Fals
                           (default: data/cleaned/cleaned_dataset.csv)
         eda_only (bool): If True, only perform EDA, don't clean
         use_ai (bool): If True, try to use AI-powered cleaning (requires OpenAI API key)
+        verbose (bool): If True, print the cleaned dataset's info and first rows
     """
     print(f"\n{'='*70}")
     print(f"INTELLIGENT DATA CLEANING & EDA PIPELINE")
@@ -75,21 +76,28 @@ def run_autoetl_custom(input_path, output_path=None, eda_only=False, use_ai=Fals
     print(f"\n🧹 Cleaning data automatically...")
     if use_ai:
         try:
-            cleaned_df = auto_clean_dataset(original_df.copy())
+            cleaned_df = auto_clean_dataset(original_df,
+                                            duplicates=eda_report['duplicates'],
+                                            missing_counts=eda_report['missing_values'])
             print("Using AI-powered cleaning mode")
         except Exception as e:
             print(f"⚠️  AI cleaning failed: {e}")
             print("Falling back to automatic adaptive cleaning...")
-            cleaned_df = auto_clean_dataset(original_df.copy())
+            cleaned_df = auto_clean_dataset(original_df,
+                                            duplicates=eda_report['duplicates'],
+                                            missing_counts=eda_report['missing_values'])
     else:
-        cleaned_df = auto_clean_dataset(original_df.copy())
+        cleaned_df = auto_clean_dataset(original_df,
+                                        duplicates=eda_report['duplicates'],
+                                        missing_counts=eda_report['missing_values'])
     
-    # Step 4: Show cleaned data info
+    # Step 4: Show cleaned data info (skips the memory scan; opt-in via --verbose)
     print(f"\n✅ CLEANING COMPLETE")
-    print(f"\n📊 Final Cleaned Dataset Info:")
-    print(cleaned_df.info())
-    print(f"\n📋 First few rows:")
-    print(cleaned_df.head(10))
+    if verbose:
+        print(f"\n📊 Final Cleaned Dataset Info:")
+        cleaned_df.info(memory_usage=False)
+        print(f"\n📋 First few rows:")
+        print(cleaned_df.iloc[:10].to_string())
     
     # Step 5: Save cleaned dataset
     print(f"\n💾 Saving cleaned dataset...")
@@ -143,6 +151,7 @@ Examples:
   python run_pipeline.py --input data/raw/data.csv --output data/cleaned/output.csv
   python run_pipeline.py --input data/raw/data.csv --eda-only
   python run_pipeline.py --input data/raw/data.csv --use-ai
+  python run_pipeline.py --input data/raw/data.csv --verbose
         """
     )
     parser.add_argument(
@@ -167,10 +176,16 @@ Examples:
         action="store_true",
         help="Use AI-powered cleaning (requires OpenAI API key in .env)"
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print the cleaned dataset's info and first rows"
+    )
     
     args = parser.parse_args()
     
-    success = run_autoetl_custom(args.input, args.output, eda_only=args.eda_only, use_ai=args.use_ai)
+    success = run_autoetl_custom(args.input, args.output, eda_only=args.eda_only, use_ai=args.use_ai,
+                                 verbose=args.verbose)
     sys.exit(0 if success else 1)
 
 
@@ -1,3 +1,5 @@
+import matplotlib
+matplotlib.use('Agg')  # headless: the chart is only written to disk
 import matplotlib.pyplot as plt
 import pandas as pd
 
@@ -29,14 +31,20 @@ def summarize_cleaning(original_df, cleaned_df):
         "----------------|--------|------\n"
     )
 
-    for col in original_missing.index:
-        summary_text += f"{col:<15} | {original_missing[col]:<6} | {cleaned_missing[col]:<5}\n"
+    # Build the table rows in one pass and join once (no repeated string copies)
+    cleaned_missing = cleaned_missing.reindex(original_missing.index)
+    rows = [
+        f"{col:<15} | {before:<6} | {after:<5}\n"
+        for col, before, after in zip(original_missing.index, original_missing.tolist(), cleaned_missing.tolist())
+    ]
 
-    summary_text += "\nCleaning Actions:\n"
-    summary_text += "- Handled missing values in 'Age' and 'Salary' columns.\n"
-    summary_text += "- Standardized capitalization in the 'City' column.\n"
-    summary_text += "- Ensured 'Joining_Date' is in a consistent format.\n"
-    summary_text += "- Removed duplicate records.\n"
+    summary_text += "".join(rows) + (
+        "\nCleaning Actions:\n"
+        "- Handled missing values in 'Age' and 'Salary' columns.\n"
+        "- Standardized capitalization in the 'City' column.\n"
+        "- Ensured 'Joining_Date' is in a consistent format.\n"
+        "- Removed duplicate records.\n"
+    )
 
     # Save text summary
     report_path = "reports/cleaning_summary.txt"
@@ -44,26 +52,21 @@ def summarize_cleaning(original_df, cleaned_df):
         f.write(summary_text)
     print(f"Text summary saved to {report_path}")
 
-    # 2. Visual Summary
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
-    
-    # Before
-    original_missing.plot(kind='bar', ax=ax1, color='salmon')
-    ax1.set_title('Missing Values Before Cleaning')
-    ax1.set_ylabel('Number of Missing Values')
-    ax1.tick_params(axis='x', rotation=45)
+    # 2. Visual Summary (before/after as one grouped bar chart)
+    fig, ax = plt.subplots(figsize=(12, 6))
     
-    # After
-    cleaned_missing.plot(kind='bar', ax=ax2, color='lightgreen')
-    ax2.set_title('Missing Values After Cleaning')
-    ax2.set_ylabel('Number of Missing Values')
-    ax2.tick_params(axis='x', rotation=45)
+    missing = pd.DataFrame({'Before': original_missing, 'After': cleaned_missing})
+    missing.plot.bar(ax=ax, color=['salmon', 'lightgreen'])
+    ax.set_title('Missing Values Before vs After Cleaning')
+    ax.set_ylabel('Number of Missing Values')
+    ax.tick_params(axis='x', rotation=45)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save visual summary
     visual_report_path = "reports/visual_summary.png"
-    plt.savefig(visual_report_path)
+    fig.savefig(visual_report_path)
+    plt.close(fig)
     print(f"Visual summary saved to {visual_report_path}")
     # plt.show()
 